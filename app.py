@@ -4,14 +4,26 @@ TIA Gather - Money Gathering App on Celestia
 Main Flask application with API routes.
 """
 
+import atexit
+import concurrent.futures
+import hashlib
 import logging
+import re
+import threading
 import time
 import uuid
-from flask import Flask, jsonify, request, render_template
+from typing import Annotated, Any, Dict, List, Literal, Optional
+from cachetools import TTLCache, cached
+from flask import Flask, Response, abort, jsonify, request, render_template
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 import httpx
+import msgspec
+import orjson
 
 from config import AppConfig
-from services import GatheringService
+from services import GatheringError, GatheringService
 
 
 def build_x402_response(
@@ -52,6 +64,27 @@ def build_x402_response(
         ],
     }
 
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """Detect an allowed image type from the first 12 bytes of a file."""
+    for signature, content_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return content_type
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+# Bech32 celestia1 address: data part uses the bech32 charset (no 1, b, i, o)
+ADDR_RE = re.compile(r"^celestia1[02-9ac-hj-np-z]{38,58}$")
+
 # Configure logging
 logging.basicConfig(
     level=logging.DEBUG if AppConfig.DEBUG else logging.INFO,
@@ -59,9 +92,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization."""
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype,
+        )
+
+
 # Initialize Flask app
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.json = ORJSONProvider(app)
 app.config.from_object(AppConfig)
+Compress(app)
 
 # Initialize services
 gathering_service = GatheringService(
@@ -69,9 +124,224 @@ gathering_service = GatheringService(
         "ONCHAINDB_ENDPOINT": AppConfig.ONCHAINDB_ENDPOINT,
         "ONCHAINDB_APP_ID": AppConfig.ONCHAINDB_APP_ID,
         "ONCHAINDB_APP_KEY": AppConfig.ONCHAINDB_APP_KEY,
+        "ONCHAINDB_MAX_CONNECTIONS": AppConfig.ONCHAINDB_MAX_CONNECTIONS,
     }
 )
 
+# Shared HTTP clients for proxy calls (pooled keep-alive connections, HTTP/2)
+http_limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+http_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    limits=http_limits,
+)
+http_client_long = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=3.0),
+    limits=http_limits,
+)
+atexit.register(http_client.close)
+atexit.register(http_client_long.close)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one upstream call.
+
+    The first caller runs fn; callers arriving while it is in flight wait on
+    the same future and get its result (or exception).
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = concurrent.futures.Future()
+
+        if owner:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+        return future.result()
+
+
+single_flight = SingleFlight()
+
+
+@cached(TTLCache(maxsize=1024, ttl=60), lock=threading.Lock(), info=True)
+def cached_quote(collection: str, size_kb: int) -> dict:
+    """Get an OnChainDB write pricing quote, cached for 60 seconds."""
+    return single_flight.do(
+        ("quote", collection, size_kb),
+        lambda: gathering_service.client.get_pricing_quote(
+            collection=collection,
+            operation_type="write",
+            size_kb=size_kb,
+        ),
+    )
+
+
+def size_in_kb(size_bytes: int) -> int:
+    """Round a payload size up to whole KB (minimum 1) for pricing."""
+    return max(1, (size_bytes + 1023) // 1024)
+
+
+def payment_required(collection: str, size_bytes: int, description: str):
+    """Build the x402 402 response for writing `size_bytes` to a collection."""
+    quote = cached_quote(collection, size_in_kb(size_bytes))
+    amount_utia = quote.get("total_cost_utia", int(quote.get("total_cost", 0) * 1_000_000))
+
+    return jsonify(build_x402_response(
+        amount_utia=amount_utia,
+        pay_to=AppConfig.BROKER_ADDRESS,
+        description=description,
+        resource=request.path,
+    )), 402
+
+
+@cached(TTLCache(maxsize=4096, ttl=5), lock=threading.Lock(), info=True)
+def fetch_celestia_balance(address: str) -> dict:
+    """Get bank balances for an address, cached for 5 seconds."""
+    def fetch():
+        response = http_client.get(f"{AppConfig.CELESTIA_REST}/cosmos/bank/v1beta1/balances/{address}")
+        response.raise_for_status()
+        return response.json()
+
+    return single_flight.do(("balance", address), fetch)
+
+
+def fetch_celestia_account(address: str) -> dict:
+    """
+    Get auth account info for an address.
+
+    Not cached: keplr.js signs with the returned sequence, and a stale one
+    from another worker's cache fails the broadcast with a sequence mismatch.
+    """
+    def fetch():
+        response = http_client.get(f"{AppConfig.CELESTIA_REST}/cosmos/auth/v1beta1/accounts/{address}")
+        response.raise_for_status()
+        return response.json()
+
+    return single_flight.do(("account", address), fetch)
+
+
+def invalidate_celestia_address(address: str) -> None:
+    """Drop the cached balance after the address sent a tx."""
+    with fetch_celestia_balance.cache_lock:
+        fetch_celestia_balance.cache.pop(fetch_celestia_balance.cache_key(address), None)
+
+
+def stream_json_list(key: str, items) -> Response:
+    """
+    Stream a {"success": true, key: [...]} body one item at a time.
+
+    Avoids holding the whole encoded list in memory for large responses.
+    """
+    def generate():
+        yield b'{"success":true,"' + key.encode() + b'":['
+        separator = b""
+        for item in items:
+            yield separator + orjson.dumps(item, option=ORJSONProvider.option)
+            separator = b","
+        yield b"]}"
+
+    return Response(generate(), mimetype="application/json")
+
+
+# Accepted ?status= values for the gatherings list ("all" disables the filter)
+GATHERING_STATUSES = frozenset({"active", "completed", "expired", "all"})
+
+
+def query_int(name: str, default: int, lo: int = 0, hi: int = 1_000_000) -> int:
+    """
+    Parse an integer query arg, clamped to [lo, hi].
+
+    Rejects non-digit and overlong values with a 400 before calling int().
+    """
+    value = request.args.get(name)
+    if value is None:
+        return default
+    if not (value.isascii() and value.isdigit()) or len(value) > 10:
+        abort(400, description=f"Invalid {name}")
+    return max(lo, min(int(value), hi))
+
+
+def conditional_json_list(key: str, items: list, *fields: str) -> Response:
+    """
+    Stream a JSON list tagged with an ETag over the given item fields.
+
+    Only the fields that can change between polls need to be hashed.
+    The tag has to be known before headers are sent, so items must be a
+    materialized list; streaming then only avoids building the encoded copy.
+    Returns an empty 304 when the client's If-None-Match already matches.
+    The ETag is weak so it stays valid across compressed encodings.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for item in items:
+        for field in fields:
+            digest.update(str(item.get(field, "")).encode())
+            digest.update(b"\x1f")
+        digest.update(b"\x1e")
+    etag = digest.hexdigest()
+
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = stream_json_list(key, items)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+# =========================================
+# REQUEST SCHEMAS
+# =========================================
+class CreateGatheringRequest(msgspec.Struct):
+    """Body of POST /api/gatherings (payment_proof omitted for a quote)."""
+
+    title: str
+    description: str
+    goal_amount: int
+    ends_at: str
+    creator: str
+    image_url: Optional[str] = None
+    payment_proof: Optional[Dict[str, Any]] = None
+
+
+class ContributeRequest(msgspec.Struct):
+    """Body of POST /api/gatherings/<id>/contribute (payment_proof omitted for a quote)."""
+
+    amount: int
+    contributor: str
+    message: Optional[str] = None
+    payment_proof: Optional[Dict[str, Any]] = None
+
+
+class PricingQuoteRequest(msgspec.Struct):
+    """One entry of POST /api/pricing/batch (size_kb bounded like /api/pricing)."""
+
+    collection: Literal["gatherings", "contributions", "images"]
+    size_kb: Annotated[int, msgspec.Meta(ge=1, le=1_000_000)] = 1
+
+
+class PricingBatchRequest(msgspec.Struct):
+    """Body of POST /api/pricing/batch."""
+
+    quotes: Annotated[List[PricingQuoteRequest], msgspec.Meta(min_length=1, max_length=20)]
+
+
+def decode_body(schema: type):
+    """Decode and validate the JSON request body (msgspec.DecodeError -> 400)."""
+    return msgspec.json.decode(request.get_data(), type=schema, strict=False)
+
 
 # =========================================
 # CORS Headers
@@ -103,22 +373,30 @@ def gathering_page(gathering_id):
 # =========================================
 # API: CONFIG
 # =========================================
+# Public config is fixed for the process lifetime, so render it once
+CONFIG_RESPONSE_BODY = orjson.dumps(
+    {
+        "success": True,
+        "config": {
+            "app_name": AppConfig.APP_NAME,
+            "chain_id": AppConfig.CELESTIA_CHAIN_ID,
+            "rpc": AppConfig.CELESTIA_RPC,
+            "rest": AppConfig.CELESTIA_REST,
+            "broker_address": AppConfig.BROKER_ADDRESS,
+            "min_contribution_utia": AppConfig.MIN_CONTRIBUTION_UTIA,
+            "creation_fee_utia": AppConfig.CREATION_FEE_UTIA,
+        },
+    }
+)
+
+
 @app.route("/api/config", methods=["GET"])
 def get_config():
     """Get public configuration for frontend."""
-    return jsonify(
-        {
-            "success": True,
-            "config": {
-                "app_name": AppConfig.APP_NAME,
-                "chain_id": AppConfig.CELESTIA_CHAIN_ID,
-                "rpc": AppConfig.CELESTIA_RPC,
-                "rest": AppConfig.CELESTIA_REST,
-                "broker_address": AppConfig.BROKER_ADDRESS,
-                "min_contribution_utia": AppConfig.MIN_CONTRIBUTION_UTIA,
-                "creation_fee_utia": AppConfig.CREATION_FEE_UTIA,
-            },
-        }
+    return Response(
+        CONFIG_RESPONSE_BODY,
+        mimetype="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
     )
 
 
@@ -128,40 +406,36 @@ def get_config():
 @app.route("/api/gatherings", methods=["GET"])
 def get_gatherings():
     """Get list of gatherings."""
-    try:
-        status = request.args.get("status", "active")
-        creator = request.args.get("creator")
-        limit = min(int(request.args.get("limit", 50)), 100)
-        offset = int(request.args.get("offset", 0))
-
-        gatherings = gathering_service.get_gatherings(
-            status=status if status != "all" else None,
-            creator=creator,
-            limit=limit,
-            offset=offset,
-        )
-
-        return jsonify({"success": True, "gatherings": gatherings})
+    status = request.args.get("status", "active")
+    if status not in GATHERING_STATUSES:
+        abort(400, description="Invalid status")
+    creator = request.args.get("creator")
+    limit = query_int("limit", 50, hi=100)
+    offset = query_int("offset", 0)
+
+    # A full list, not iter_gatherings(): the ETag covers every item
+    gatherings = gathering_service.get_gatherings(
+        status=status if status != "all" else None,
+        creator=creator,
+        limit=limit,
+        offset=offset,
+    )
 
-    except Exception as e:
-        logger.error(f"Error getting gatherings: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Gatherings are immutable; only their derived stats change
+    return conditional_json_list(
+        "gatherings", gatherings, "id", "current_amount", "contributor_count", "status"
+    )
 
 
 @app.route("/api/gatherings/<gathering_id>", methods=["GET"])
 def get_gathering(gathering_id):
     """Get a single gathering with its contributions."""
-    try:
-        gathering = gathering_service.get_gathering(gathering_id)
+    gathering = gathering_service.get_gathering(gathering_id)
 
-        if not gathering:
-            return jsonify({"success": False, "error": "Gathering not found"}), 404
+    if not gathering:
+        return jsonify({"success": False, "error": "Gathering not found"}), 404
 
-        return jsonify({"success": True, "gathering": gathering})
-
-    except Exception as e:
-        logger.error(f"Error getting gathering {gathering_id}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, "gathering": gathering})
 
 
 @app.route("/api/gatherings", methods=["POST"])
@@ -170,62 +444,35 @@ def create_gathering():
 
     If payment_proof is not provided, returns 402 with required amount from pricing quote.
     """
-    try:
-        data = request.get_json()
-
-        # Validate required fields (payment_proof is optional for quote)
-        required = ["title", "description", "goal_amount", "ends_at", "creator"]
-        for field in required:
-            if field not in data:
-                return jsonify({"success": False, "error": f"Missing field: {field}"}), 400
-
-        payment_proof = data.get("payment_proof")
-
-        # If no payment_proof, get pricing quote and return 402
-        if not payment_proof or not payment_proof.get("payment_tx_hash"):
-            # Calculate data size for pricing
-            gathering_data = {
-                "title": data["title"],
-                "description": data["description"],
-                "goal_amount": data["goal_amount"],
-                "ends_at": data["ends_at"],
-            }
-            import json
-            data_size = len(json.dumps(gathering_data))
-            size_kb = max(1, (data_size + 1023) // 1024)
-
-            # Get pricing quote from OnChainDB
-            quote = gathering_service.client.get_pricing_quote(
-                collection="gatherings",
-                operation_type="write",
-                size_kb=size_kb,
-            )
-
-            # Read x402 properties from quote
-            amount_utia = quote.get("total_cost_utia", int(quote.get("total_cost", 0) * 1_000_000))
-
-            return jsonify(build_x402_response(
-                amount_utia=amount_utia,
-                pay_to=AppConfig.BROKER_ADDRESS,
-                description=f"Create gathering: {data['title'][:30]}",
-                resource=request.path,
-            )), 402
-
-        gathering = gathering_service.create_gathering(
-            title=data["title"],
-            description=data["description"],
-            goal_amount=int(data["goal_amount"]),
-            ends_at=data["ends_at"],
-            creator=data["creator"],
-            payment_proof=payment_proof,
-            image_url=data.get("image_url"),
+    data = decode_body(CreateGatheringRequest)
+    payment_proof = data.payment_proof
+
+    # If no payment_proof, get pricing quote and return 402
+    if not payment_proof or not payment_proof.get("payment_tx_hash"):
+        # Calculate data size for pricing
+        gathering_data = {
+            "title": data.title,
+            "description": data.description,
+            "goal_amount": data.goal_amount,
+            "ends_at": data.ends_at,
+        }
+        return payment_required(
+            "gatherings",
+            len(orjson.dumps(gathering_data)),
+            f"Create gathering: {data.title[:30]}",
         )
 
-        return jsonify({"success": True, "gathering": gathering})
+    gathering = gathering_service.create_gathering(
+        title=data.title,
+        description=data.description,
+        goal_amount=data.goal_amount,
+        ends_at=data.ends_at,
+        creator=data.creator,
+        payment_proof=payment_proof,
+        image_url=data.image_url,
+    )
 
-    except Exception as e:
-        logger.error(f"Error creating gathering: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, "gathering": gathering})
 
 
 # =========================================
@@ -237,90 +484,51 @@ def contribute(gathering_id):
 
     If payment_proof is not provided, returns 402 with required amount from pricing quote.
     """
-    try:
-        data = request.get_json()
-
-        # Validate required fields (payment_proof is optional for quote)
-        required = ["amount", "contributor"]
-        for field in required:
-            if field not in data:
-                return jsonify({"success": False, "error": f"Missing field: {field}"}), 400
-
-        amount = int(data["amount"])
-        payment_proof = data.get("payment_proof")
-
-        # If no payment_proof, get pricing quote and return 402
-        if not payment_proof or not payment_proof.get("payment_tx_hash"):
-            # Calculate data size for pricing
-            import json
-            contribution_data = {
-                "gathering_id": gathering_id,
-                "amount": amount,
-                "message": data.get("message", ""),
-            }
-            data_size = len(json.dumps(contribution_data))
-            size_kb = max(1, (data_size + 1023) // 1024)
-
-            # Get pricing quote from OnChainDB
-            quote = gathering_service.client.get_pricing_quote(
-                collection="contributions",
-                operation_type="write",
-                size_kb=size_kb,
-            )
-
-            # Read x402 properties from quote
-            amount_utia = quote.get("total_cost_utia", int(quote.get("total_cost", 0) * 1_000_000))
-
-            return jsonify(build_x402_response(
-                amount_utia=amount_utia,
-                pay_to=AppConfig.BROKER_ADDRESS,
-                description="Contribute to gathering",
-                resource=request.path,
-            )), 402
-
-        contribution = gathering_service.contribute(
-            gathering_id=gathering_id,
-            amount=amount,
-            contributor=data["contributor"],
-            message=data.get("message", ""),
-            payment_proof=payment_proof,
+    data = decode_body(ContributeRequest)
+    payment_proof = data.payment_proof
+
+    # If no payment_proof, get pricing quote and return 402
+    if not payment_proof or not payment_proof.get("payment_tx_hash"):
+        # Calculate data size for pricing
+        contribution_data = {
+            "gathering_id": gathering_id,
+            "amount": data.amount,
+            "message": data.message,
+        }
+        return payment_required(
+            "contributions",
+            len(orjson.dumps(contribution_data)),
+            "Contribute to gathering",
         )
 
-        return jsonify({"success": True, "contribution": contribution})
+    contribution = gathering_service.contribute(
+        gathering_id=gathering_id,
+        amount=data.amount,
+        contributor=data.contributor,
+        message=data.message,
+        payment_proof=payment_proof,
+    )
 
-    except ValueError as e:
-        return jsonify({"success": False, "error": str(e)}), 400
-    except Exception as e:
-        logger.error(f"Error contributing to gathering {gathering_id}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, "contribution": contribution})
 
 
 @app.route("/api/gatherings/<gathering_id>/contributions", methods=["GET"])
 def get_contributions(gathering_id):
     """Get contributions for a gathering."""
-    try:
-        limit = min(int(request.args.get("limit", 100)), 500)
-        contributions = gathering_service.get_contributions(gathering_id, limit=limit)
+    limit = query_int("limit", 100, hi=500)
+    contributions = gathering_service.get_contributions(gathering_id, limit=limit)
 
-        return jsonify({"success": True, "contributions": contributions})
-
-    except Exception as e:
-        logger.error(f"Error getting contributions for {gathering_id}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Contributions are append-only, so their IDs identify the list
+    return conditional_json_list("contributions", contributions, "id")
 
 
 @app.route("/api/recent-contributions", methods=["GET"])
 def get_recent_contributions():
     """Get recent contributions across all gatherings."""
-    try:
-        limit = min(int(request.args.get("limit", 10)), 50)
-        contributions = gathering_service.get_recent_contributions(limit=limit)
-
-        return jsonify({"success": True, "contributions": contributions})
+    limit = query_int("limit", 10, hi=50)
+    contributions = gathering_service.get_recent_contributions(limit=limit)
 
-    except Exception as e:
-        logger.error(f"Error getting recent contributions: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return conditional_json_list("contributions", contributions, "id")
 
 
 # =========================================
@@ -329,29 +537,23 @@ def get_recent_contributions():
 @app.route("/api/user/<address>/gatherings", methods=["GET"])
 def get_user_gatherings(address):
     """Get gatherings created by a user."""
-    try:
-        limit = min(int(request.args.get("limit", 50)), 100)
-        gatherings = gathering_service.get_user_gatherings(address, limit=limit)
+    if not ADDR_RE.match(address):
+        return jsonify({"success": False, "error": "Invalid address"}), 400
+    limit = query_int("limit", 50, hi=100)
+    gatherings = gathering_service.get_user_gatherings(address, limit=limit)
 
-        return jsonify({"success": True, "gatherings": gatherings})
-
-    except Exception as e:
-        logger.error(f"Error getting user gatherings for {address}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, "gatherings": gatherings})
 
 
 @app.route("/api/user/<address>/contributions", methods=["GET"])
 def get_user_contributions(address):
     """Get contributions made by a user."""
-    try:
-        limit = min(int(request.args.get("limit", 50)), 100)
-        contributions = gathering_service.get_user_contributions(address, limit=limit)
-
-        return jsonify({"success": True, "contributions": contributions})
+    if not ADDR_RE.match(address):
+        return jsonify({"success": False, "error": "Invalid address"}), 400
+    limit = query_int("limit", 50, hi=100)
+    contributions = gathering_service.get_user_contributions(address, limit=limit)
 
-    except Exception as e:
-        logger.error(f"Error getting user contributions for {address}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, "contributions": contributions})
 
 
 # =========================================
@@ -360,13 +562,8 @@ def get_user_contributions(address):
 @app.route("/api/stats", methods=["GET"])
 def get_stats():
     """Get platform statistics."""
-    try:
-        stats = gathering_service.get_stats()
-        return jsonify({"success": True, "stats": stats})
-
-    except Exception as e:
-        logger.error(f"Error getting stats: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    stats = gathering_service.get_stats()
+    return jsonify({"success": True, "stats": stats})
 
 
 # =========================================
@@ -377,51 +574,59 @@ def get_pricing():
     """Get pricing for operations from OnChainDB."""
     operation = request.args.get("operation", "contribute")
     # Estimate data size (KB) for the operation
-    size_kb = int(request.args.get("size_kb", 1))
-
-    try:
-        # Determine collection based on operation
-        collection = "gatherings" if operation == "create" else "contributions"
-
-        # Get actual pricing from OnChainDB
-        url = f"{AppConfig.ONCHAINDB_ENDPOINT}/api/pricing/quote"
-
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                url,
-                json={
-                    "app_id": AppConfig.ONCHAINDB_APP_ID,
-                    "operation_type": "write",
-                    "size_kb": size_kb,
-                    "collection": collection,
-                },
-                headers={
-                    "Content-Type": "application/json",
-                    "X-App-Key": AppConfig.ONCHAINDB_APP_KEY,
-                },
-            )
-            response.raise_for_status()
-            quote_data = response.json()
+    size_kb = query_int("size_kb", 1, lo=1)
+
+    # Determine collection based on operation
+    collection = "gatherings" if operation == "create" else "contributions"
+
+    # Get actual pricing from OnChainDB
+    quote_data = cached_quote(collection, size_kb)
+
+    # Extract the total cost from the quote
+    total_cost_tia = quote_data.get("total_cost_tia", quote_data.get("total_cost", 0))
+    amount_utia = int(total_cost_tia * 1_000_000)
+
+    return jsonify({
+        "success": True,
+        "pricing": {
+            "operation": operation,
+            "size_kb": size_kb,
+            "amount_utia": amount_utia,
+            "amount_tia": total_cost_tia,
+            "broker_address": AppConfig.BROKER_ADDRESS,
+            "quote_details": quote_data,
+        },
+    })
 
-        # Extract the total cost from the quote
+
+@app.route("/api/pricing/batch", methods=["POST"])
+def get_pricing_batch():
+    """
+    Get pricing for several writes in one call.
+
+    Expects JSON: {"quotes": [{"collection": "gatherings", "size_kb": 1}, ...]}
+    """
+    body = decode_body(PricingBatchRequest)
+
+    quotes = []
+    for item in body.quotes:
+        collection, size_kb = item.collection, item.size_kb
+        quote_data = cached_quote(collection, size_kb)
         total_cost_tia = quote_data.get("total_cost_tia", quote_data.get("total_cost", 0))
-        amount_utia = int(total_cost_tia * 1_000_000)
-
-        return jsonify({
-            "success": True,
-            "pricing": {
-                "operation": operation,
-                "size_kb": size_kb,
-                "amount_utia": amount_utia,
-                "amount_tia": total_cost_tia,
-                "broker_address": AppConfig.BROKER_ADDRESS,
-                "quote_details": quote_data,
-            },
+
+        quotes.append({
+            "collection": collection,
+            "size_kb": size_kb,
+            "amount_utia": int(total_cost_tia * 1_000_000),
+            "amount_tia": total_cost_tia,
+            "quote_details": quote_data,
         })
 
-    except Exception as e:
-        logger.error(f"Error getting pricing: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({
+        "success": True,
+        "broker_address": AppConfig.BROKER_ADDRESS,
+        "quotes": quotes,
+    })
 
 
 # =========================================
@@ -430,77 +635,68 @@ def get_pricing():
 @app.route("/api/celestia/balance/<address>", methods=["GET"])
 def get_celestia_balance(address):
     """Get wallet balance from Celestia REST API."""
-    try:
-        url = f"{AppConfig.CELESTIA_REST}/cosmos/bank/v1beta1/balances/{address}"
-
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            data = response.json()
+    if not ADDR_RE.match(address):
+        return jsonify({"success": False, "error": "Invalid address"}), 400
+    data = fetch_celestia_balance(address)
 
-        return jsonify({"success": True, **data})
-
-    except Exception as e:
-        logger.error(f"Error getting balance for {address}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    response = jsonify({"success": True, **data})
+    response.headers["Cache-Control"] = "private, max-age=5"
+    return response
 
 
 @app.route("/api/celestia/account/<address>", methods=["GET"])
 def get_celestia_account(address):
     """Get account info from Celestia REST API (for signing)."""
-    try:
-        url = f"{AppConfig.CELESTIA_REST}/cosmos/auth/v1beta1/accounts/{address}"
+    if not ADDR_RE.match(address):
+        return jsonify({"success": False, "error": "Invalid address"}), 400
+    data = fetch_celestia_account(address)
 
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-        return jsonify({"success": True, **data})
-
-    except Exception as e:
-        logger.error(f"Error getting account for {address}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, **data})
 
 
 @app.route("/api/celestia/broadcast", methods=["POST"])
 def broadcast_celestia_tx():
-    """Broadcast transaction to Celestia network."""
-    try:
-        data = request.get_json()
-        tx_bytes = data.get("tx_bytes")
-        mode = data.get("mode", "BROADCAST_MODE_SYNC")
+    """Broadcast transaction to Celestia network.
 
-        if not tx_bytes:
-            return jsonify({"success": False, "error": "Missing tx_bytes"}), 400
+    The optional `sender` address has its cached balance invalidated
+    once the tx is submitted; a malformed sender is ignored rather than
+    failing a tx that was already broadcast.
+    """
+    data = request.get_json()
+    tx_bytes = data.get("tx_bytes")
+    mode = data.get("mode", "BROADCAST_MODE_SYNC")
+    sender = data.get("sender")
+    if not (isinstance(sender, str) and ADDR_RE.match(sender)):
+        sender = None
 
-        url = f"{AppConfig.CELESTIA_REST}/cosmos/tx/v1beta1/txs"
+    if not tx_bytes:
+        return jsonify({"success": False, "error": "Missing tx_bytes"}), 400
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                url,
-                json={"tx_bytes": tx_bytes, "mode": mode},
-            )
+    url = f"{AppConfig.CELESTIA_REST}/cosmos/tx/v1beta1/txs"
+
+    response = http_client_long.post(
+        url,
+        json={"tx_bytes": tx_bytes, "mode": mode},
+    )
 
-            result = response.json()
+    result = response.json()
 
-            # Check for broadcast errors
-            if "tx_response" in result:
-                tx_response = result["tx_response"]
-                if tx_response.get("code", 0) != 0:
-                    return jsonify(
-                        {
-                            "success": False,
-                            "error": tx_response.get("raw_log", "Transaction failed"),
-                            "tx_response": tx_response,
-                        }
-                    ), 400
+    if sender:
+        invalidate_celestia_address(sender)
 
-        return jsonify({"success": True, **result})
+    # Check for broadcast errors
+    if "tx_response" in result:
+        tx_response = result["tx_response"]
+        if tx_response.get("code", 0) != 0:
+            return jsonify(
+                {
+                    "success": False,
+                    "error": tx_response.get("raw_log", "Transaction failed"),
+                    "tx_response": tx_response,
+                }
+            ), 400
 
-    except Exception as e:
-        logger.error(f"Error broadcasting transaction: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({"success": True, **result})
 
 
 # =========================================
@@ -518,163 +714,168 @@ def upload_blob():
     - broker_address: Broker address
     - amount_utia: Amount paid in utia
     """
-    try:
-        # Check if file is present
-        if "file" not in request.files:
-            return jsonify({"success": False, "error": "No file provided"}), 400
-
-        file = request.files["file"]
-        if file.filename == "":
-            return jsonify({"success": False, "error": "No file selected"}), 400
-
-        # Validate file type
-        allowed_types = {"image/png", "image/jpeg", "image/gif", "image/webp"}
-        content_type = file.content_type or "application/octet-stream"
-        if content_type not in allowed_types:
-            return jsonify({"success": False, "error": f"Invalid file type: {content_type}"}), 400
-
-        # Read file data
-        blob_data = file.read()
-
-        # Size limit (1.5MB for Celestia blobs)
-        if len(blob_data) > 1.5 * 1024 * 1024:
+    # Check if file is present
+    if "file" not in request.files:
+        return jsonify({"success": False, "error": "No file provided"}), 400
+
+    file = request.files["file"]
+    if file.filename == "":
+        return jsonify({"success": False, "error": "No file selected"}), 400
+
+    # Validate file type
+    allowed_types = {"image/png", "image/jpeg", "image/gif", "image/webp"}
+    content_type = file.content_type or "application/octet-stream"
+    if content_type not in allowed_types:
+        return jsonify({"success": False, "error": f"Invalid file type: {content_type}"}), 400
+
+    # Read file data in chunks, aborting as soon as it exceeds the blob limit
+    buffer = bytearray()
+    for chunk in iter(lambda: file.stream.read(65536), b""):
+        buffer.extend(chunk)
+        if len(buffer) > AppConfig.MAX_BLOB_SIZE:
             return jsonify({"success": False, "error": "File too large (max 1.5MB)"}), 400
-
-        # Get payment proof from form data (optional - if missing, returns 402)
-        payment_tx_hash = request.form.get("payment_tx_hash", "")
-
-        # If no payment, get pricing quote and return 402
-        if not payment_tx_hash:
-            size_kb = max(1, (len(blob_data) + 1023) // 1024)
-
-            # Get pricing quote from OnChainDB
-            quote = gathering_service.client.get_pricing_quote(
-                collection="images",
-                operation_type="write",
-                size_kb=size_kb,
-            )
-
-            # Read x402 properties from quote
-            amount_utia = quote.get("total_cost_utia", int(quote.get("total_cost", 0) * 1_000_000))
-
-            return jsonify(build_x402_response(
-                amount_utia=amount_utia,
-                pay_to=AppConfig.BROKER_ADDRESS,
-                description=f"Upload image ({size_kb}KB)",
-                resource=request.path,
-            )), 402
-
-        payment_proof = {
-            "payment_tx_hash": payment_tx_hash,
-            "user_address": request.form.get("user_address", ""),
-            "broker_address": request.form.get("broker_address", ""),
-            "amount_utia": int(request.form.get("amount_utia", 0)),
-        }
-
-        # Store blob via SDK
-        result = gathering_service.client.store_blob(
-            collection="images",
-            blob_data=blob_data,
-            payment_proof=payment_proof,
-            filename=file.filename,
-            content_type=content_type,
+    blob_data = bytes(buffer)
+
+    # Trust the file's magic bytes over the client-declared type
+    content_type = sniff_image_type(blob_data[:12])
+    if content_type is None:
+        return jsonify({"success": False, "error": "File is not a supported image"}), 400
+
+    # Get payment proof from form data (optional - if missing, returns 402)
+    payment_tx_hash = request.form.get("payment_tx_hash", "")
+
+    # If no payment, get pricing quote and return 402
+    if not payment_tx_hash:
+        return payment_required(
+            "images",
+            len(blob_data),
+            f"Upload image ({size_in_kb(len(blob_data))}KB)",
         )
 
-        blob_id = result.get("blob_id")
-        blob_url = f"/api/blobs/{blob_id}"
+    payment_proof = {
+        "payment_tx_hash": payment_tx_hash,
+        "user_address": request.form.get("user_address", ""),
+        "broker_address": request.form.get("broker_address", ""),
+        "amount_utia": int(request.form.get("amount_utia", 0)),
+    }
 
-        return jsonify({
-            "success": True,
-            "blob_id": blob_id,
-            "blob_url": blob_url,
-            "size_bytes": len(blob_data),
-            "content_type": content_type,
-        })
+    # Store blob via SDK
+    gathering_service.ensure_collections()
+    result = gathering_service.client.store_blob(
+        collection="images",
+        blob_data=blob_data,
+        payment_proof=payment_proof,
+        filename=file.filename,
+        content_type=content_type,
+    )
+
+    blob_id = result.get("blob_id")
+    blob_url = f"/api/blobs/{blob_id}"
 
-    except Exception as e:
-        logger.error(f"Error uploading blob: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    return jsonify({
+        "success": True,
+        "blob_id": blob_id,
+        "blob_url": blob_url,
+        "size_bytes": len(blob_data),
+        "content_type": content_type,
+    })
 
 
 @app.route("/api/blobs/<blob_id>", methods=["GET"])
 def get_blob(blob_id):
     """
     Retrieve a blob by ID.
-    Proxies to OnChainDB which fetches from Celestia.
-    """
-    try:
-        # Proxy to OnChainDB blob endpoint
-        url = f"{AppConfig.ONCHAINDB_ENDPOINT}/api/apps/{AppConfig.ONCHAINDB_APP_ID}/blobs/images/{blob_id}"
-
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(
-                url,
-                headers={"X-App-Key": AppConfig.ONCHAINDB_APP_KEY},
-            )
-
-            if response.status_code == 404:
-                return jsonify({"success": False, "error": "Blob not found"}), 404
+    Proxies to OnChainDB which fetches from Celestia, streaming the
+    bytes through instead of buffering the whole blob.
 
-            response.raise_for_status()
-
-            # Return the blob with proper content type
-            content_type = response.headers.get("content-type", "application/octet-stream")
-            return response.content, 200, {"Content-Type": content_type}
+    Blobs are content-addressed and immutable, so they are served with a
+    long-lived Cache-Control and the blob ID as ETag.
+    """
+    cache_headers = {
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "ETag": f'"{blob_id}"',
+    }
+    if request.if_none_match.contains(blob_id):
+        return "", 304, cache_headers
+
+    # Proxy to OnChainDB blob endpoint
+    url = f"{AppConfig.ONCHAINDB_ENDPOINT}/api/apps/{AppConfig.ONCHAINDB_APP_ID}/blobs/images/{blob_id}"
+
+    upstream = http_client_long.send(
+        http_client_long.build_request(
+            "GET",
+            url,
+            headers={"X-App-Key": AppConfig.ONCHAINDB_APP_KEY},
+        ),
+        stream=True,
+    )
 
-    except Exception as e:
-        logger.error(f"Error retrieving blob {blob_id}: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+    if upstream.is_error:
+        upstream.close()
+        if upstream.status_code == 404:
+            return jsonify({"success": False, "error": "Blob not found"}), 404
+        upstream.raise_for_status()
+
+    # Stream the blob through with proper content type
+    content_type = upstream.headers.get("content-type", "application/octet-stream")
+    response = Response(
+        upstream.iter_bytes(65536),
+        content_type=content_type,
+        headers=cache_headers,
+        direct_passthrough=True,
+    )
+    response.call_on_close(upstream.close)
+    return response
 
 
 @app.route("/api/blobs/pricing", methods=["GET"])
 def get_blob_pricing():
     """Get pricing for blob upload from OnChainDB."""
-    size_kb = int(request.args.get("size_kb", 100))
-
-    try:
-        # Get actual pricing from OnChainDB
-        url = f"{AppConfig.ONCHAINDB_ENDPOINT}/api/pricing/quote"
-
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                url,
-                json={
-                    "app_id": AppConfig.ONCHAINDB_APP_ID,
-                    "operation_type": "write",
-                    "size_kb": size_kb,
-                    "collection": "images",
-                },
-                headers={
-                    "Content-Type": "application/json",
-                    "X-App-Key": AppConfig.ONCHAINDB_APP_KEY,
-                },
-            )
-            response.raise_for_status()
-            quote_data = response.json()
+    size_kb = query_int("size_kb", 100, lo=1)
+
+    # Get actual pricing from OnChainDB
+    quote_data = cached_quote("images", size_kb)
+
+    # Extract the total cost from the quote
+    total_cost_tia = quote_data.get("total_cost_tia", quote_data.get("total_cost", 0))
+    amount_utia = int(total_cost_tia * 1_000_000)
+
+    return jsonify({
+        "success": True,
+        "pricing": {
+            "size_kb": size_kb,
+            "amount_utia": amount_utia,
+            "amount_tia": total_cost_tia,
+            "broker_address": AppConfig.BROKER_ADDRESS,
+            "quote_details": quote_data,
+        }
+    })
 
-        # Extract the total cost from the quote
-        total_cost_tia = quote_data.get("total_cost_tia", quote_data.get("total_cost", 0))
-        amount_utia = int(total_cost_tia * 1_000_000)
-
-        return jsonify({
-            "success": True,
-            "pricing": {
-                "size_kb": size_kb,
-                "amount_utia": amount_utia,
-                "amount_tia": total_cost_tia,
-                "broker_address": AppConfig.BROKER_ADDRESS,
-                "quote_details": quote_data,
-            }
-        })
 
-    except Exception as e:
-        logger.error(f"Error getting blob pricing: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+# =========================================
+# API: ADMIN
+# =========================================
+@app.route("/api/admin/cache-stats", methods=["GET"])
+def get_cache_stats():
+    """Get hit/miss counters for in-process caches."""
+    return jsonify({
+        "success": True,
+        "caches": {
+            "pricing_quotes": cached_quote.cache_info()._asdict(),
+            "celestia_balances": fetch_celestia_balance.cache_info()._asdict(),
+        },
+    })
 
 
 # =========================================
 # ERROR HANDLERS
 # =========================================
+@app.errorhandler(400)
+def bad_request(e):
+    """Handle 400 errors (malformed query args or JSON bodies)."""
+    return jsonify({"success": False, "error": e.description}), 400
+
+
 @app.errorhandler(404)
 def not_found(e):
     """Handle 404 errors."""
@@ -683,13 +884,35 @@ def not_found(e):
     return render_template("index.html")
 
 
+@app.errorhandler(413)
+def request_too_large(e):
+    """Handle request bodies over MAX_CONTENT_LENGTH."""
+    return jsonify({"success": False, "error": "Request too large (max 1.5MB file)"}), 413
+
+
 @app.errorhandler(500)
 def server_error(e):
     """Handle 500 errors."""
-    logger.error(f"Server error: {e}")
+    logger.error("Server error: %s", e)
     return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
+@app.errorhandler(msgspec.DecodeError)
+@app.errorhandler(GatheringError)
+def invalid_value(e):
+    """Handle invalid request bodies and rejected gathering operations as 400."""
+    return jsonify({"success": False, "error": str(e)}), 400
+
+
+@app.errorhandler(Exception)
+def unhandled_exception(e):
+    """Handle errors raised by views (upstream failures) as JSON 500."""
+    if isinstance(e, HTTPException):
+        return e
+    logger.error("Error handling %s %s: %s", request.method, request.path, e)
+    return jsonify({"success": False, "error": str(e)}), 500
+
+
 # =========================================
 # MAIN
 # =========================================
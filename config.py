@@ -23,6 +23,7 @@ class Config:
     ONCHAINDB_ENDPOINT = os.getenv("ONCHAINDB_ENDPOINT", "http://localhost:9092")
     ONCHAINDB_APP_ID = os.getenv("ONCHAINDB_APP_ID", "")
     ONCHAINDB_APP_KEY = os.getenv("ONCHAINDB_APP_KEY", "")
+    ONCHAINDB_MAX_CONNECTIONS = int(os.getenv("ONCHAINDB_MAX_CONNECTIONS", "64"))  # Per worker pool
 
     # Celestia Network
     CELESTIA_CHAIN_ID = os.getenv("CELESTIA_CHAIN_ID", "mocha-4")
@@ -35,6 +36,17 @@ class Config:
     MIN_CONTRIBUTION_UTIA = int(os.getenv("MIN_CONTRIBUTION_UTIA", "100000"))  # 0.1 TIA
     CREATION_FEE_UTIA = int(os.getenv("CREATION_FEE_UTIA", "500000"))  # 0.5 TIA
 
+    # Uploads
+    MAX_BLOB_SIZE = int(1.5 * 1024 * 1024)  # Celestia blob limit
+    MAX_CONTENT_LENGTH = int(1.55 * 1024 * 1024)  # Blob plus multipart overhead
+
+    # Response compression (Flask-Compress); images are already compressed
+    COMPRESS_MIMETYPES = ["application/json"]
+    COMPRESS_ALGORITHM = ["br", "gzip"]
+    # Streamed lists use a separate setting whose default has no gzip
+    COMPRESS_ALGORITHM_STREAMING = ["br", "gzip"]
+    COMPRESS_MIN_SIZE = 500
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -2,11 +2,15 @@
 """
 Create OnChainDB indexes for the Money Gathering App using the new SDK schema API.
 
+The app also syncs these schemas lazily on its first write; this script is
+for explicit setup and for seeing the per-index result.
+
 Run: python scripts/create_indexes.py
 """
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,7 +19,12 @@ load_dotenv()
 # Add parent directory to path for local SDK development
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'db-client', 'sdk-python'))
 
-from onchaindb import OnChainDBClient, SimpleCollectionSchema
+from onchaindb import OnChainDBClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services import PooledHttpClient
+from services.schemas import COLLECTION_SCHEMAS, STATS_VIEW, create_stats_view
 
 ENDPOINT = os.getenv("ONCHAINDB_ENDPOINT", "http://localhost:9092")
 APP_ID = os.getenv("ONCHAINDB_APP_ID", "")
@@ -36,99 +45,62 @@ def main():
         endpoint=ENDPOINT,
         app_id=APP_ID,
         app_key=APP_KEY,
+        http_client=PooledHttpClient(app_key=APP_KEY),
     )
 
-    # ============================================
-    # GATHERINGS COLLECTION SCHEMA
-    # ============================================
-    gatherings_schema: SimpleCollectionSchema = {
-        "name": "gatherings",
-        "fields": {
-            "id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
-            "creator": {"type": "string", "index": True, "indexType": "hash"},
-            "status": {"type": "string", "index": True, "indexType": "hash"},
-            "created_at": {"type": "date", "index": True},
-            "ends_at": {"type": "date", "index": True},
-            "goal_amount": {"type": "number", "index": True},
-        },
-        "use_base_fields": False,  # We define our own fields
-    }
-
-    # ============================================
-    # CONTRIBUTIONS COLLECTION SCHEMA
-    # ============================================
-    contributions_schema: SimpleCollectionSchema = {
-        "name": "contributions",
-        "fields": {
-            "id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
-            "gathering_id": {"type": "string", "index": True, "indexType": "hash"},
-            "contributor": {"type": "string", "index": True, "indexType": "hash"},
-            "amount": {"type": "number", "index": True},
-            "created_at": {"type": "date", "index": True},
-            "payment_tx_hash": {"type": "string", "index": True, "indexType": "hash"},
-        },
-        "use_base_fields": False,
-    }
-
-    # ============================================
-    # IMAGES COLLECTION SCHEMA (Blob Storage)
-    # ============================================
-    images_schema: SimpleCollectionSchema = {
-        "name": "images",
-        "fields": {
-            "blob_id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
-            "content_type": {"type": "string", "index": True},
-            "size_bytes": {"type": "number", "index": True},
-            "uploaded_at": {"type": "date", "index": True},
-            "gathering_id": {"type": "string", "index": True, "indexType": "hash"},
-        },
-        "use_base_fields": False,
-    }
-
-    schemas = [
-        ("gatherings", gatherings_schema),
-        ("contributions", contributions_schema),
-        ("images", images_schema),
-    ]
+    schemas = COLLECTION_SCHEMAS
 
     success_count = 0
     error_count = 0
 
-    for name, schema in schemas:
-        print(f"\n{'=' * 50}")
-        print(f"Syncing collection: {name}")
-        print(f"{'=' * 50}")
-
+    def sync(schema):
         try:
             # Use syncCollection to create/update indexes
-            result = client.sync_collection(schema)
+            return client.sync_collection(schema), None
+        except Exception as e:
+            return None, e
+
+    # Collections are independent, so sync them concurrently
+    with ThreadPoolExecutor(max_workers=len(schemas)) as executor:
+        results = list(executor.map(sync, [schema for _, schema in schemas]))
 
-            print(f"  Success: {result.get('success', False)}")
+    # Collect the report and write it in one go
+    lines = []
+    for (name, _), (result, error) in zip(schemas, results):
+        lines.append(f"\n{'=' * 50}")
+        lines.append(f"Syncing collection: {name}")
+        lines.append(f"{'=' * 50}")
 
-            if result.get("created"):
-                print(f"  Created indexes:")
-                for idx in result["created"]:
-                    print(f"    - {idx['field']} ({idx['type']})")
+        if error is not None:
+            lines.append(f"  FAILED: {str(error)}")
+            error_count += 1
+            continue
 
-            if result.get("removed"):
-                print(f"  Removed indexes:")
-                for idx in result["removed"]:
-                    print(f"    - {idx['field']} ({idx['type']})")
+        lines.append(f"  Success: {result.get('success', False)}")
 
-            if result.get("unchanged"):
-                print(f"  Unchanged indexes: {len(result['unchanged'])}")
+        if result.get("created"):
+            lines.append(f"  Created indexes:")
+            for idx in result["created"]:
+                lines.append(f"    - {idx['field']} ({idx['type']})")
 
-            if result.get("errors"):
-                print(f"  Errors:")
-                for err in result["errors"]:
-                    print(f"    - {err}")
-                error_count += 1
-            else:
-                success_count += 1
+        if result.get("removed"):
+            lines.append(f"  Removed indexes:")
+            for idx in result["removed"]:
+                lines.append(f"    - {idx['field']} ({idx['type']})")
 
-        except Exception as e:
-            print(f"  FAILED: {str(e)}")
+        if result.get("unchanged"):
+            lines.append(f"  Unchanged indexes: {len(result['unchanged'])}")
+
+        if result.get("errors"):
+            lines.append(f"  Errors:")
+            for err in result["errors"]:
+                lines.append(f"    - {err}")
             error_count += 1
+        else:
+            success_count += 1
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     # ============================================
     # CREATE MATERIALIZED VIEW: gatherings_with_stats
@@ -138,38 +110,20 @@ def main():
     print(f"{'=' * 50}")
 
     try:
-        view = client.create_view(
-            name="gatherings_with_stats",
-            source_collections=["gatherings", "contributions"],
-            query={
-                "base": "gatherings",
-                "join": {
-                    "contributions": {
-                        "on": {"gathering_id": "$data.id"},
-                        "type": "left",
-                    }
-                },
-                "aggregate": {
-                    "current_amount": {"$sum": "contributions.amount"},
-                    "contributor_count": {"$count": "contributions.id"},
-                },
-                "group_by": ["id"],
-            }
-        )
-        print(f"  View created: {view.get('name', 'gatherings_with_stats')}")
-        success_count += 1
-    except Exception as e:
-        error_msg = str(e)
-        if "already exists" in error_msg.lower() or "duplicate" in error_msg.lower():
+        view = create_stats_view(client)
+        if view is None:
             print("  View already exists (skipped)")
         else:
-            print(f"  FAILED: {error_msg}")
-            # Try to refresh if it exists
-            try:
-                client.refresh_view("gatherings_with_stats")
-                print("  Refreshed existing view")
-            except:
-                pass
+            print(f"  View created: {view.get('name', STATS_VIEW)}")
+            success_count += 1
+    except Exception as e:
+        print(f"  FAILED: {str(e)}")
+        # Try to refresh if it exists
+        try:
+            client.refresh_view(STATS_VIEW)
+            print("  Refreshed existing view")
+        except:
+            pass
 
     print()
     print("=" * 50)
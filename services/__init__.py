@@ -1,5 +1,6 @@
 """Services module for TIA Gathering App."""
 
-from .gathering_service import GatheringService
+from .gathering_service import GatheringError, GatheringService
+from .http_client import PooledHttpClient
 
-__all__ = ["GatheringService"]
+__all__ = ["GatheringError", "GatheringService", "PooledHttpClient"]
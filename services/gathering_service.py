@@ -10,15 +10,48 @@ Architecture:
   that JOINs gatherings with contributions and aggregates
 """
 
-import uuid
+import hashlib
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from cachetools import LRUCache, TTLCache
 from onchaindb import OnChainDBClient
+from onchaindb.exceptions import QueryException
+
+import orjson
+
+from .http_client import PooledHttpClient
+from .schemas import COLLECTION_SCHEMAS, STATS_VIEW, STATS_VIEW_QUERY, create_stats_view
 
 logger = logging.getLogger(__name__)
 
+STATS_PAGE_SIZE = 500
+# List queries read limit * LIST_SCAN_FACTOR rows to sort and status-filter
+LIST_SCAN_FACTOR = 5
+# After a failed collection sync, writes skip retrying it for this long
+SYNC_RETRY_SECONDS = 300
+
+# Changes whenever a schema or the view changes, so edited schemas get re-synced
+SCHEMA_VERSION = hashlib.sha256(
+    orjson.dumps([COLLECTION_SCHEMAS, STATS_VIEW, STATS_VIEW_QUERY], option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:12]
+
+# Ids: 44-bit ms timestamp + 16-bit per-process counter, as 12 Crockford base32 chars
+ID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+_id_counter = itertools.count(int.from_bytes(os.urandom(2), "big"))
+
+
+class GatheringError(ValueError):
+    """A request the service rejects (unknown, completed or expired gathering)."""
+
 
 class GatheringService:
     """Service for managing money gatherings and contributions."""
@@ -35,21 +68,134 @@ class GatheringService:
             endpoint=config["ONCHAINDB_ENDPOINT"],
             app_id=config["ONCHAINDB_APP_ID"],
             app_key=config["ONCHAINDB_APP_KEY"],
+            http_client=PooledHttpClient(
+                app_key=config["ONCHAINDB_APP_KEY"],
+                max_connections=config.get("ONCHAINDB_MAX_CONNECTIONS", 64),
+            ),
         )
+        # Cleared once the stats view is found missing, to skip retrying it
+        self._stats_view_available = True
+        # get_gathering results; contributions are append-only, so a short
+        # TTL plus invalidation on contribute() keeps them fresh
+        self._gathering_cache = TTLCache(maxsize=1024, ttl=5)
+        self._gathering_cache_lock = threading.Lock()
+        # Raw gathering records never change once stored, so they need no TTL
+        self._record_cache = LRUCache(maxsize=4096)
+        self._record_cache_lock = threading.Lock()
+        # Collections are synced on the first write; the sentinel file lets
+        # later processes for the same app and schema version skip the sync
+        self._collections_synced = False
+        self._sync_failed_at: Optional[float] = None
+        self._sync_lock = threading.Lock()
+        self._sync_sentinel = os.path.join(
+            tempfile.gettempdir(),
+            f".onchaindb-synced-{config['ONCHAINDB_APP_ID']}-{SCHEMA_VERSION}",
+        )
+        self._log_prefix = "[GatheringService] "
         self._log("GatheringService initialized")
 
-    def _log(self, message: str) -> None:
-        """Log a message with service prefix."""
-        logger.info(f"[GatheringService] {message}")
+    def _log(self, msg_fmt: str, *args: Any) -> None:
+        """
+        Log a %-style message with service prefix.
+
+        Arguments are only formatted when the record is emitted, and nothing
+        is built at all when INFO is off.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self._log_prefix + msg_fmt, *args)
+
+    def ensure_collections(self) -> None:
+        """
+        Sync collection indexes and the stats view once, before the first write.
+
+        Skipped when this process already synced or the sentinel file for the
+        current app and schema version exists. Failures are logged rather than
+        failing the write, and retried on a write at least SYNC_RETRY_SECONDS
+        later so a broken sync does not add its upstream calls to every write.
+        """
+        if self._collections_synced or self._sync_backing_off():
+            return
+
+        with self._sync_lock:
+            if self._collections_synced or self._sync_backing_off():
+                return
+
+            if not os.path.exists(self._sync_sentinel):
+                self._log("Syncing collection schemas")
+                try:
+                    for name, schema in COLLECTION_SCHEMAS:
+                        result = self.client.sync_collection(schema)
+                        if result.get("errors"):
+                            raise ValueError(f"{name}: {result['errors']}")
+                    self._create_stats_view()
+                except Exception as e:
+                    self._sync_failed_at = time.monotonic()
+                    logger.warning(
+                        "%sCollection sync failed, retrying in %ss: %s", self._log_prefix, SYNC_RETRY_SECONDS, e
+                    )
+                    return
+
+                try:
+                    open(self._sync_sentinel, "a").close()
+                except OSError:
+                    pass
+
+            self._collections_synced = True
+
+    def _sync_backing_off(self) -> bool:
+        """Whether the last collection sync failed less than SYNC_RETRY_SECONDS ago."""
+        failed_at = self._sync_failed_at
+        return failed_at is not None and time.monotonic() - failed_at < SYNC_RETRY_SECONDS
+
+    def _create_stats_view(self) -> None:
+        """Create the stats view, treating an existing view as success."""
+        create_stats_view(self.client)
+        self._stats_view_available = True
+
+    def _newest_first(self, records: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """
+        Return the newest `limit` records by created_at, newest first.
+
+        The SDK sends order_by's field but not its direction, so a
+        descending sort cannot be pushed to the server yet.
+        """
+        return heapq.nlargest(limit, records, key=lambda r: r.get("created_at", ""))
 
     def _generate_id(self) -> str:
-        """Generate a unique ID for gatherings/contributions."""
-        return uuid.uuid4().hex[:12]
+        """Generate a unique, time-ordered 12-char ID for gatherings/contributions."""
+        value = ((time.time_ns() // 1_000_000) & 0xFFFFFFFFFFF) << 16 | (next(_id_counter) & 0xFFFF)
+        chars = []
+        for _ in range(12):
+            chars.append(ID_ALPHABET[value & 31])
+            value >>= 5
+        return "".join(reversed(chars))
 
     def _now_iso(self) -> str:
         """Get current UTC timestamp in ISO format."""
         return datetime.now(timezone.utc).isoformat()
 
+    def _iso_to_ts(self, value: str) -> Optional[int]:
+        """Parse an ISO datetime (naive means UTC) to epoch seconds, or None."""
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (AttributeError, ValueError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    def _ends_at_ts(self, gathering: Dict[str, Any]) -> Optional[int]:
+        """Get a gathering's end as epoch seconds (parsed for legacy records)."""
+        ends_at_ts = gathering.get("ends_at_ts")
+        if ends_at_ts is not None:
+            return ends_at_ts
+        return self._iso_to_ts(gathering.get("ends_at"))
+
+    def _is_expired(self, gathering: Dict[str, Any], now_ts: int) -> bool:
+        """Check whether a gathering's end time is before now_ts."""
+        ends_at_ts = self._ends_at_ts(gathering)
+        return ends_at_ts is not None and now_ts > ends_at_ts
+
     # =========================================
     # GATHERING OPERATIONS
     # =========================================
@@ -79,7 +225,8 @@ class GatheringService:
         Returns:
             The created gathering record with blockchain info.
         """
-        self._log(f"Creating gathering: {title} by {creator}")
+        self._log("Creating gathering: %s by %s", title, creator)
+        self.ensure_collections()
 
         gathering_id = self._generate_id()
         now = self._now_iso()
@@ -98,13 +245,21 @@ class GatheringService:
             "image_url": image_url or "",
         }
 
+        # Epoch copy of ends_at so reads compare ints instead of parsing dates
+        ends_at_ts = self._iso_to_ts(ends_at)
+        if ends_at_ts is not None:
+            gathering["ends_at_ts"] = ends_at_ts
+
         result = self.client.store(
             collection="gatherings",
             data=[gathering],
             payment_proof=payment_proof,
         )
 
-        self._log(f"Gathering created: {gathering_id}")
+        self._log("Gathering created: %s", gathering_id)
+
+        with self._record_cache_lock:
+            self._record_cache[gathering_id] = gathering
 
         return {
             **gathering,
@@ -113,6 +268,25 @@ class GatheringService:
             "blockchain": result,
         }
 
+    def _get_gathering_record(self, gathering_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored gathering record, without stats.
+
+        Gatherings are immutable, so found records are cached for the life
+        of the process. Misses are not cached: the gathering may be created
+        by another worker later.
+        """
+        with self._record_cache_lock:
+            gathering = self._record_cache.get(gathering_id)
+        if gathering is not None:
+            return gathering
+
+        gathering = self.client.find_unique("gatherings", {"id": gathering_id})
+        if gathering:
+            with self._record_cache_lock:
+                self._record_cache[gathering_id] = gathering
+        return gathering
+
     def get_gathering(self, gathering_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a single gathering by ID with computed stats.
@@ -123,9 +297,14 @@ class GatheringService:
         Returns:
             The gathering record with stats, or None if not found.
         """
-        self._log(f"Getting gathering: {gathering_id}")
+        with self._gathering_cache_lock:
+            cached = self._gathering_cache.get(gathering_id)
+        if cached is not None:
+            return cached
 
-        gathering = self.client.find_unique("gatherings", {"id": gathering_id})
+        self._log("Getting gathering: %s", gathering_id)
+
+        gathering = self._get_gathering_record(gathering_id)
 
         if not gathering:
             return None
@@ -143,15 +322,10 @@ class GatheringService:
             status = "completed"
 
         # Check if expired
-        if status == "active":
-            try:
-                ends_at = datetime.fromisoformat(gathering["ends_at"].replace("Z", "+00:00"))
-                if datetime.now(timezone.utc) > ends_at:
-                    status = "expired"
-            except (KeyError, ValueError):
-                pass
+        if status == "active" and self._is_expired(gathering, int(time.time())):
+            status = "expired"
 
-        return {
+        result = {
             **gathering,
             "current_amount": current_amount,
             "contributor_count": contributor_count,
@@ -159,6 +333,11 @@ class GatheringService:
             "contributions": contributions,
         }
 
+        with self._gathering_cache_lock:
+            self._gathering_cache[gathering_id] = result
+
+        return result
+
     def get_gatherings(
         self,
         status: Optional[str] = None,
@@ -169,9 +348,6 @@ class GatheringService:
         """
         Get gatherings with computed stats.
 
-        Uses the gatherings_with_stats view when available, falls back to
-        computing stats from contributions.
-
         Args:
             status: Filter by status (active, completed, expired).
             creator: Filter by creator wallet address.
@@ -181,66 +357,204 @@ class GatheringService:
         Returns:
             List of gathering records with stats.
         """
-        self._log(f"Getting gatherings (status={status}, creator={creator})")
+        return list(self.iter_gatherings(status=status, creator=creator, limit=limit, offset=offset))
+
+    def iter_gatherings(
+        self,
+        status: Optional[str] = None,
+        creator: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate gatherings with computed stats, newest first.
+
+        The base query runs immediately; stats are computed lazily per
+        gathering, and iteration stops once `limit` matches were yielded.
+
+        Args:
+            status: Filter by status (active, completed, expired).
+            creator: Filter by creator wallet address.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Returns:
+            Iterator over gathering records with stats.
+        """
+        self._log("Getting gatherings (status=%s, creator=%s)", status, creator)
+
+        if self._stats_view_available:
+            try:
+                rows = self.get_gatherings_from_view(
+                    creator=creator, status=status, limit=limit * LIST_SCAN_FACTOR
+                )
+                gatherings = self._newest_first(rows, len(rows))
+                return self._iter_with_status(gatherings, status, limit)
+            except QueryException as e:
+                self._handle_view_error(e)
 
         # Query base gatherings
-        query = self.client.query_builder().collection("gatherings")
+        query = self._filter_gatherings(self.client.query_builder().collection("gatherings"), creator, status)
+        query = query.select_all().limit(limit * LIST_SCAN_FACTOR)  # Fetch extra to account for filtering
+
+        response = query.execute()
+        records = response.get("records", [])
+
+        # ids are unique-indexed; in debug, surface duplicates instead of hiding them
+        if logger.isEnabledFor(logging.DEBUG):
+            duplicates = len(records) - len({r.get("id") for r in records})
+            if duplicates:
+                logger.warning("%sQuery returned %d duplicate gathering ids", self._log_prefix, duplicates)
 
+        records = self._newest_first(records, len(records))
+
+        return self._iter_with_status(self._iter_with_stats(records), status, limit)
+
+    def _handle_view_error(self, error: QueryException) -> None:
+        """Switch to per-gathering stats if the view is missing, else re-raise."""
+        message = str(error).lower()
+        if "not found" not in message and "404" not in message:
+            raise error
+        self._log("Stats view unavailable, computing stats per gathering: %s", error)
+        self._stats_view_available = False
+
+    def _filter_gatherings(self, query: Any, creator: Optional[str], status: Optional[str]) -> Any:
+        """
+        Apply the creator and stored-status predicates as one condition.
+
+        Derived "active" implies stored "active", so that filter can use the
+        status index. Each where_field() call replaces the builder's find, so
+        both predicates go into a single and-group.
+        """
+        conditions = []
         if creator:
-            query = query.where_field("creator").equals(creator)
+            conditions.append(("creator", creator))
+        if status == "active":
+            conditions.append(("status", "active"))
 
-        query = query.select_all().limit(limit * 5)  # Fetch extra to account for filtering
+        if len(conditions) == 1:
+            field, value = conditions[0]
+            return query.where_field(field).equals(value)
+        if conditions:
+            return query.find(lambda c: c.and_group(lambda: [c.field(f).equals(v) for f, v in conditions]))
+        return query
+
+    def get_gatherings_from_view(
+        self,
+        creator: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get gatherings with stats from the gatherings_with_stats view.
+
+        The view already joins and aggregates contributions, so this is a
+        single query instead of one contributions query per gathering.
+
+        Args:
+            creator: Filter by creator wallet address.
+            status: Derived status the caller will filter on. Only "active"
+                maps onto the stored status; completed/expired depend on the
+                aggregate and the clock, so the caller still post-filters.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+            order_by: Field to sort ascending on, for stable offset paging.
+                The SDK drops the direction, so newest-first lists are
+                sorted by the caller instead.
+
+        Returns:
+            List of gathering records with current_amount and contributor_count.
+
+        Raises:
+            QueryException: If the query fails (including a missing view).
+        """
+        query = self._filter_gatherings(self.client.query_builder().collection(STATS_VIEW), creator, status)
+
+        query = query.select_all()
+        if order_by:
+            query = query.order_by(order_by)
+        query = query.offset(offset).limit(limit)
 
         response = query.execute()
-        records = response.get("records", [])
+        return [
+            {
+                **r,
+                "current_amount": r.get("current_amount", 0),
+                "contributor_count": r.get("contributor_count", 0),
+            }
+            for r in response.get("records", [])
+        ]
+
+    def _iter_view_pages(self, page_size: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every view row, page by page, until a short page.
+
+        Pages are ordered by id so offsets stay stable between calls and no
+        row is skipped or counted twice. The first page runs eagerly so a missing view raises to the caller;
+        later pages are fetched as the caller iterates.
+        """
+        page_size = max(page_size, 1)
+        page = self.get_gatherings_from_view(limit=page_size, order_by="id")
 
-        # Deduplicate by id (in case of any duplicates)
-        seen_ids = set()
-        unique_gatherings = []
-        for r in records:
-            gid = r.get("id")
-            if gid and gid not in seen_ids:
-                seen_ids.add(gid)
-                unique_gatherings.append(r)
-
-        # Compute stats for each gathering
-        gatherings_with_stats = []
-        for gathering in unique_gatherings:
-            gathering_id = gathering.get("id")
-
-            # Get contributions and compute stats
-            contributions = self.get_contributions(gathering_id, limit=1000)
-            current_amount = sum(c.get("amount", 0) for c in contributions)
-            contributor_count = len(contributions)
+        def pages():
+            current, offset = page, 0
+            while True:
+                yield from current
+                if len(current) < page_size:
+                    return
+                offset += len(current)
+                current = self.get_gatherings_from_view(limit=page_size, offset=offset, order_by="id")
+
+        return pages()
+
+    def _iter_with_stats(
+        self,
+        gatherings: List[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield gatherings with stats computed from their contributions."""
+        for gathering in gatherings:
+            current_amount, contributor_count = self.get_contribution_totals(gathering.get("id"))
+            yield {
+                **gathering,
+                "current_amount": current_amount,
+                "contributor_count": contributor_count,
+            }
+
+    def _iter_with_status(
+        self,
+        gatherings,
+        status: Optional[str],
+        limit: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield gatherings with derived status, filtered by status."""
+        if limit <= 0:
+            return
+
+        now_ts = int(time.time())
+        count = 0
+        for gathering in gatherings:
+            current_amount = gathering["current_amount"]
 
             # Determine status
             g_status = gathering.get("status", "active")
             if g_status == "active":
                 if current_amount >= gathering.get("goal_amount", 0):
                     g_status = "completed"
-                else:
-                    try:
-                        ends_at = datetime.fromisoformat(gathering["ends_at"].replace("Z", "+00:00"))
-                        if datetime.now(timezone.utc) > ends_at:
-                            g_status = "expired"
-                    except (KeyError, ValueError):
-                        pass
-
-            gatherings_with_stats.append({
-                **gathering,
-                "current_amount": current_amount,
-                "contributor_count": contributor_count,
-                "status": g_status,
-            })
+                elif self._is_expired(gathering, now_ts):
+                    g_status = "expired"
 
-        # Filter by status
-        if status:
-            gatherings_with_stats = [g for g in gatherings_with_stats if g.get("status") == status]
+            # Filter by status
+            if status and g_status != status:
+                continue
 
-        # Sort by created_at descending (newest first)
-        gatherings_with_stats.sort(key=lambda g: g.get("created_at", ""), reverse=True)
+            yield {**gathering, "status": g_status}
 
-        return gatherings_with_stats[:limit]
+            # Stop before pulling another row (and possibly another page)
+            count += 1
+            if count >= limit:
+                return
 
     def get_active_gatherings(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get all active gatherings."""
@@ -261,7 +575,7 @@ class GatheringService:
         gathering_id: str,
         amount: int,
         contributor: str,
-        message: str,
+        message: Optional[str],
         payment_proof: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
@@ -276,29 +590,28 @@ class GatheringService:
 
         Returns:
             The contribution record with blockchain info.
+
+        Raises:
+            GatheringError: If the gathering is missing, completed or expired.
         """
-        self._log(f"Adding contribution to {gathering_id}: {amount} utia from {contributor}")
+        self._log("Adding contribution to %s: %s utia from %s", gathering_id, amount, contributor)
+        self.ensure_collections()
 
-        # Get gathering to validate (uses find_unique for latest version)
-        gathering = self.client.find_unique("gatherings", {"id": gathering_id})
+        # Get gathering to validate (immutable, so usually served from cache)
+        gathering = self._get_gathering_record(gathering_id)
         if not gathering:
-            raise ValueError(f"Gathering not found: {gathering_id}")
+            raise GatheringError(f"Gathering not found: {gathering_id}")
 
         # Check base status
         if gathering.get("status") == "completed":
-            raise ValueError("Gathering has already reached its goal")
+            raise GatheringError("Gathering has already reached its goal")
 
-        # Check if gathering has expired
-        try:
-            ends_at = datetime.fromisoformat(gathering["ends_at"].replace("Z", "+00:00"))
-            if datetime.now(timezone.utc) > ends_at:
-                raise ValueError("Gathering has expired")
-        except (KeyError, ValueError) as e:
-            if "expired" in str(e).lower():
-                raise
+        # Check if gathering has expired (one clock read for the check and created_at)
+        now = datetime.now(timezone.utc)
+        if self._is_expired(gathering, int(now.timestamp())):
+            raise GatheringError("Gathering has expired")
 
         contribution_id = self._generate_id()
-        now = self._now_iso()
 
         contribution = {
             "id": contribution_id,
@@ -307,7 +620,7 @@ class GatheringService:
             "amount": amount,
             "message": message or "",
             "payment_tx_hash": payment_proof.get("payment_tx_hash", ""),
-            "created_at": now,
+            "created_at": now.isoformat(),
         }
 
         result = self.client.store(
@@ -316,9 +629,12 @@ class GatheringService:
             payment_proof=payment_proof,
         )
 
-        self._log(f"Contribution created: {contribution_id}")
+        self._log("Contribution created: %s", contribution_id)
 
-        # No need to update gathering - stats computed from view/aggregation
+        # No need to update gathering - stats computed from view/aggregation,
+        # but drop the cached stats so the new contribution shows up
+        with self._gathering_cache_lock:
+            self._gathering_cache.pop(gathering_id, None)
 
         return {
             **contribution,
@@ -340,7 +656,7 @@ class GatheringService:
         Returns:
             List of contribution records.
         """
-        self._log(f"Getting contributions for gathering: {gathering_id}")
+        self._log("Getting contributions for gathering: %s", gathering_id)
 
         query = (
             self.client.query_builder()
@@ -351,18 +667,57 @@ class GatheringService:
         )
 
         response = query.execute()
-        contributions = response.get("records", [])
+        contributions = self._newest_first(response.get("records", []), limit)
+        return self._intern_contributions(contributions)
+
+    def _intern_contributions(self, contributions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Intern repeated address/id strings so duplicates share one object."""
+        for c in contributions:
+            for key in ("contributor", "gathering_id"):
+                value = c.get(key)
+                if type(value) is str:
+                    c[key] = sys.intern(value)
+        return contributions
 
-        # Sort by created_at descending (newest first)
-        contributions.sort(key=lambda c: c.get("created_at", ""), reverse=True)
+    def get_contribution_totals(
+        self,
+        gathering_id: str,
+        limit: int = 1000,
+    ) -> Tuple[int, int]:
+        """
+        Get the total amount and number of contributions for a gathering.
 
-        return contributions
+        Only the amount field is requested and the rows are folded in one
+        pass, so no full contribution records are built or sorted.
+
+        Args:
+            gathering_id: The gathering ID.
+            limit: Maximum number of contributions to count.
+
+        Returns:
+            Tuple of (total amount in utia, contribution count).
+        """
+        query = (
+            self.client.query_builder()
+            .collection("contributions")
+            .where_field("gathering_id").equals(gathering_id)
+            .select_fields(["amount"])
+            .limit(limit)
+        )
+
+        response = query.execute()
+
+        total = count = 0
+        for c in response.get("records", []):
+            total += c.get("amount", 0)
+            count += 1
+        return total, count
 
     def get_user_contributions(
         self, contributor: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get all contributions by a user."""
-        self._log(f"Getting contributions by user: {contributor}")
+        self._log("Getting contributions by user: %s", contributor)
 
         query = (
             self.client.query_builder()
@@ -373,52 +728,63 @@ class GatheringService:
         )
 
         response = query.execute()
-        contributions = response.get("records", [])
-
-        # Sort by created_at descending
-        contributions.sort(key=lambda c: c.get("created_at", ""), reverse=True)
-
-        return contributions
+        contributions = self._newest_first(response.get("records", []), limit)
+        return self._intern_contributions(contributions)
 
     def get_recent_contributions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent contributions across all gatherings."""
-        self._log(f"Getting recent contributions (limit={limit})")
+        self._log("Getting recent contributions (limit=%s)", limit)
 
         query = (
             self.client.query_builder()
             .collection("contributions")
             .select_all()
-            .limit(limit * 3)  # Fetch extra for deduplication
+            .limit(limit * 3)  # Fetch extra, then keep the newest
         )
 
         response = query.execute()
-        contributions = response.get("records", [])
-
-        # Sort by created_at descending
-        contributions.sort(key=lambda c: c.get("created_at", ""), reverse=True)
-
-        return contributions[:limit]
+        contributions = self._newest_first(response.get("records", []), limit)
+        return self._intern_contributions(contributions)
 
     # =========================================
     # STATISTICS
     # =========================================
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get platform statistics."""
+        """
+        Get platform statistics.
+
+        Scans the stats view page by page, so every gathering is counted
+        and only one running total per field is kept. Without the view,
+        falls back to the first 1000 gatherings with per-gathering stats.
+        """
         self._log("Getting platform stats")
 
-        # Get all gatherings with computed stats
-        all_gatherings = self.get_gatherings(limit=1000)
+        gatherings = None
+        if self._stats_view_available:
+            try:
+                rows = self._iter_view_pages(STATS_PAGE_SIZE)
+                gatherings = self._iter_with_status(rows, None, sys.maxsize)
+            except QueryException as e:
+                self._handle_view_error(e)
+        if gatherings is None:
+            gatherings = self.iter_gatherings(limit=1000)
 
         # Calculate totals
-        active_count = len([g for g in all_gatherings if g.get("status") == "active"])
-        completed_count = len([g for g in all_gatherings if g.get("status") == "completed"])
-        total_raised = sum(g.get("current_amount", 0) for g in all_gatherings)
-        total_contributors = sum(g.get("contributor_count", 0) for g in all_gatherings)
+        total_count = active_count = completed_count = 0
+        total_raised = total_contributors = 0
+        for g in gatherings:
+            total_count += 1
+            if g["status"] == "active":
+                active_count += 1
+            elif g["status"] == "completed":
+                completed_count += 1
+            total_raised += g.get("current_amount", 0)
+            total_contributors += g.get("contributor_count", 0)
 
         return {
             "active_gatherings": active_count,
-            "total_gatherings": len(all_gatherings),
+            "total_gatherings": total_count,
             "completed_gatherings": completed_count,
             "total_raised_utia": total_raised,
             "total_raised_tia": total_raised / 1_000_000,
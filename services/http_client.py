@@ -0,0 +1,131 @@
+"""
+PooledHttpClient - OnChainDB SDK HTTP client with HTTP/2 and a tuned pool.
+
+The SDK's default HttpClient opens a plain HTTP/1.1 httpx.Client. Pages fan
+out many small queries, so multiplexing them over one kept-alive HTTP/2
+connection avoids repeated TCP/TLS handshakes. JSON bodies are encoded and
+decoded with orjson instead of the stdlib json module.
+
+Implements the SDK's public HttpClientInterface (post/get/delete, plus the
+post_multipart used by store_blob) rather than subclassing its HttpClient.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+from onchaindb.exceptions import HttpException, PaymentRequiredException
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _payment_required(content: bytes) -> PaymentRequiredException:
+    """Build a PaymentRequiredException from an x402 402 response body."""
+    try:
+        accepts = orjson.loads(content).get("accepts") or []
+    except (orjson.JSONDecodeError, AttributeError):
+        accepts = []
+    if not accepts:
+        return PaymentRequiredException(message="Payment required", amount_utia=0, pay_to="")
+
+    accept = accepts[0]
+    return PaymentRequiredException(
+        message="Payment required",
+        amount_utia=int(accept.get("maxAmountRequired", "0")),
+        pay_to=accept.get("payTo", ""),
+        quote_id=accept.get("quoteId"),
+        expires_at=accept.get("expiresAt"),
+        resource=accept.get("resource"),
+        description=accept.get("description"),
+    )
+
+
+class PooledHttpClient:
+    """SDK HttpClientInterface backed by an HTTP/2 httpx.Client with explicit pool limits and orjson."""
+
+    def __init__(
+        self,
+        app_key: str,
+        user_key: Optional[str] = None,
+        timeout: float = 30.0,
+        max_connections: int = 64,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 60.0,
+        pool_timeout: float = 5.0,
+    ):
+        """
+        Initialize the pooled client.
+
+        Args:
+            app_key: OnChainDB application key (sent as X-App-Key).
+            user_key: Optional user key for Auto-Pay (sent as X-User-Key).
+            timeout: Request timeout in seconds.
+            max_connections: Maximum open connections in the pool.
+            max_keepalive_connections: Maximum idle connections kept alive
+                (defaults to max_connections).
+            keepalive_expiry: Seconds an idle connection is kept alive.
+            pool_timeout: Seconds to wait for a free pooled connection before
+                failing, rather than stalling behind a saturated pool.
+        """
+        # Content-Type is set per request so multipart uploads can share the pool
+        headers: Dict[str, str] = {"X-App-Key": app_key}
+        if user_key is not None:
+            headers["X-User-Key"] = user_key
+
+        self._client = httpx.Client(
+            headers=headers,
+            timeout=httpx.Timeout(timeout, pool=pool_timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections or max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Send a request and decode the JSON response with orjson.
+
+        Mirrors the SDK's error mapping: 402 raises PaymentRequiredException,
+        other HTTP errors and transport failures raise HttpException.
+        """
+        try:
+            response = self._client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 402:
+                raise _payment_required(e.response.content) from e
+            raise HttpException(
+                f"HTTP error {e.response.status_code}: {e.response.text}",
+                status_code=e.response.status_code,
+            ) from e
+        except httpx.RequestError as e:
+            raise HttpException(f"Request failed: {str(e)}") from e
+
+    def post(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a POST request with a JSON body."""
+        return self._send("POST", url, content=orjson.dumps(data), headers=JSON_HEADERS)
+
+    def get(self, url: str) -> Dict[str, Any]:
+        """Send a GET request."""
+        return self._send("GET", url)
+
+    def delete(self, url: str) -> Dict[str, Any]:
+        """Send a DELETE request."""
+        return self._send("DELETE", url)
+
+    def post_multipart(self, url: str, files: Dict[str, Any], data: Dict[str, str]) -> Dict[str, Any]:
+        """Send a multipart POST (blob uploads) over the pooled connection."""
+        return self._send("POST", url, files=files, data=data)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "PooledHttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
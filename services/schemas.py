@@ -0,0 +1,108 @@
+"""
+OnChainDB collection schemas and views for TIA Gather.
+
+Shared by GatheringService (lazy sync on first write) and
+scripts/create_indexes.py (explicit setup).
+"""
+
+from typing import Any, Dict, Optional
+
+from onchaindb import OnChainDBClient, SimpleCollectionSchema
+
+# ============================================
+# GATHERINGS COLLECTION SCHEMA
+# ============================================
+GATHERINGS_SCHEMA: SimpleCollectionSchema = {
+    "name": "gatherings",
+    "fields": {
+        "id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
+        "creator": {"type": "string", "index": True, "indexType": "hash"},
+        "status": {"type": "string", "index": True, "indexType": "hash"},
+        "created_at": {"type": "date", "index": True},
+        "ends_at": {"type": "date", "index": True},
+        "ends_at_ts": {"type": "number", "index": True},
+        "goal_amount": {"type": "number", "index": True},
+    },
+    "use_base_fields": False,  # We define our own fields
+}
+
+# ============================================
+# CONTRIBUTIONS COLLECTION SCHEMA
+# ============================================
+CONTRIBUTIONS_SCHEMA: SimpleCollectionSchema = {
+    "name": "contributions",
+    "fields": {
+        "id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
+        "gathering_id": {"type": "string", "index": True, "indexType": "hash"},
+        "contributor": {"type": "string", "index": True, "indexType": "hash"},
+        "amount": {"type": "number", "index": True},
+        "created_at": {"type": "date", "index": True},
+        "payment_tx_hash": {"type": "string", "index": True, "indexType": "hash"},
+    },
+    "use_base_fields": False,
+}
+
+# ============================================
+# IMAGES COLLECTION SCHEMA (Blob Storage)
+# ============================================
+IMAGES_SCHEMA: SimpleCollectionSchema = {
+    "name": "images",
+    "fields": {
+        "blob_id": {"type": "string", "index": True, "unique": True, "indexType": "hash"},
+        "content_type": {"type": "string", "index": True},
+        "size_bytes": {"type": "number", "index": True},
+        "uploaded_at": {"type": "date", "index": True},
+        "gathering_id": {"type": "string", "index": True, "indexType": "hash"},
+    },
+    "use_base_fields": False,
+}
+
+COLLECTION_SCHEMAS = [
+    ("gatherings", GATHERINGS_SCHEMA),
+    ("contributions", CONTRIBUTIONS_SCHEMA),
+    ("images", IMAGES_SCHEMA),
+]
+
+# ============================================
+# MATERIALIZED VIEW: gatherings_with_stats
+# ============================================
+# Joins gatherings with aggregated contribution stats
+STATS_VIEW = "gatherings_with_stats"
+STATS_VIEW_SOURCES = ["gatherings", "contributions"]
+STATS_VIEW_QUERY = {
+    "base": "gatherings",
+    "join": {
+        "contributions": {
+            "on": {"gathering_id": "$data.id"},
+            "type": "left",
+        }
+    },
+    "aggregate": {
+        "current_amount": {"$sum": "contributions.amount"},
+        "contributor_count": {"$count": "contributions.id"},
+    },
+    "group_by": ["id"],
+}
+
+
+def create_stats_view(client: OnChainDBClient) -> Optional[Dict[str, Any]]:
+    """
+    Create the stats view.
+
+    Returns:
+        The created view, or None if it already exists.
+
+    Raises:
+        Exception: Any other create_view failure.
+    """
+    try:
+        return client.create_view(
+            name=STATS_VIEW,
+            source_collections=STATS_VIEW_SOURCES,
+            query=STATS_VIEW_QUERY,
+        )
+    except Exception as e:
+        message = str(e).lower()
+        if "already exists" in message or "duplicate" in message:
+            return None
+        raise
@@ -248,6 +248,7 @@ async function signAndBroadcast(recipientAddress, amountUtia, memo = '') {
         body: JSON.stringify({
             tx_bytes: txBytesBase64,
             mode: 'BROADCAST_MODE_SYNC',
+            sender: window.wallet.address,
         }),
     });
 